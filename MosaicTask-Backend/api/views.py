@@ -48,7 +48,11 @@ class BoardViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated, IsBoardMember]
 
     def get_queryset(self):
-        return self.queryset.filter(members=self.request.user)
+        queryset = self.queryset.filter(
+            members=self.request.user).prefetch_related('members')
+        if self.action == 'retrieve':
+            queryset = queryset.prefetch_related('lists__tasks__assigned_to')
+        return queryset
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
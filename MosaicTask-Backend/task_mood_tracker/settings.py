@@ -71,9 +71,17 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Build the test database's tables straight from the models instead
+        # of replaying migrations on every run.
+        'TEST': {
+            'MIGRATE': False,
+        },
     }
 }
 
+# manage.py test already forces DEBUG off; this runner also mutes logging.
+TEST_RUNNER = 'task_mood_tracker.test_runner.QuietDiscoverRunner'
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -0,0 +1,32 @@
+import logging
+
+from django.test.runner import DiscoverRunner, ParallelTestSuite
+
+
+def disable_logging(*args):
+    logging.disable(logging.CRITICAL)
+
+
+class QuietParallelTestSuite(ParallelTestSuite):
+    # Django only calls process_setup in workers started with "spawn" (the
+    # default on macOS and Windows); forked workers inherit the parent's
+    # logging state from QuietDiscoverRunner.setup_test_environment().
+    process_setup = disable_logging
+
+
+class QuietDiscoverRunner(DiscoverRunner):
+    """
+    Test runner that disables logging while the suite runs.
+
+    Error responses exercised by the tests would otherwise build a log
+    record per request on the django.request logger.
+    """
+    parallel_test_suite = QuietParallelTestSuite
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        disable_logging()
+
+    def teardown_test_environment(self, **kwargs):
+        logging.disable(logging.NOTSET)
+        super().teardown_test_environment(**kwargs)